@@ -1,18 +1,28 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError
 import os
+import re
+import base64
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, EmailStr
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator, Literal, Type
 import uuid
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 import jwt
+import orjson
+from cachetools import TTLCache
 from passlib.context import CryptContext
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 ROOT_DIR = Path(__file__).parent
@@ -20,26 +30,88 @@ load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=int(os.environ.get('MONGO_MAX_POOL_SIZE', '200')),
+    minPoolSize=int(os.environ.get('MONGO_MIN_POOL_SIZE', '20')),
+    # Negotiated with the server in order; zlib is the stdlib fallback for
+    # servers or environments without zstd
+    compressors=os.environ.get('MONGO_COMPRESSORS', 'zstd,zlib'),
+    retryWrites=True,
+    serverSelectionTimeoutMS=3000,
+)
 db = client[os.environ['DB_NAME']]
 
+# Multi-document transactions need a replica set or sharded cluster; detected at startup
+transactions_supported = False
+
 # Security
 SECRET_KEY = os.environ.get("JWT_SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Verify tokens with a pre-built JWK so PyJWT reuses the prepared HMAC key
+# instead of re-deriving it from SECRET_KEY on every decode
+_jwt_verification_key = jwt.PyJWK(
+    {"kty": "oct", "k": base64.urlsafe_b64encode(SECRET_KEY.encode()).rstrip(b"=").decode()},
+    algorithm=ALGORITHM,
+)
+_jwt_algorithms = [ALGORITHM]
+
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "10"))
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+# bcrypt releases the GIL, so one worker per core hashes in parallel without
+# competing with other to_thread work on the default executor
+_password_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash")
 security = HTTPBearer()
 
+# Validated users keyed by sha256 of the bearer token, so repeat requests skip
+# both jwt.decode and the users lookup. Entries also carry the token's exp so a
+# cached user is never served past token expiry.
+TOKEN_CACHE_TTL_SECONDS = 30
+_token_cache = TTLCache(maxsize=10000, ttl=TOKEN_CACHE_TTL_SECONDS)
+
+# Serialized /products pages keyed by their query parameters. Cleared whenever
+# products or their stock change.
+PRODUCTS_CACHE_TTL_SECONDS = 5
+_products_cache = TTLCache(maxsize=1024, ttl=PRODUCTS_CACHE_TTL_SECONDS)
+
+CORS_ORIGINS = tuple(origin.strip() for origin in os.environ.get('CORS_ORIGINS', '*').split(','))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup logic
+    print("Server is starting...")
+    await create_indexes()
+    await asyncio.gather(
+        detect_transaction_support(),
+        backfill_product_name_lower(),
+        create_default_admin(),
+        create_sample_products(),
+    )
+    yield
+    # Shutdown logic
+    print("Server is shutting down...")
+    _password_executor.shutdown(wait=False)
+    client.close()
+
 # Create the main app
-app = FastAPI(title="E-commerce API")
+app = FastAPI(title="E-commerce API", default_response_class=ORJSONResponse, lifespan=lifespan)
 api_router = APIRouter(prefix="/api")
 
+def generate_id() -> str:
+    # 32-char hex: skips the dashed str() formatting of the UUID
+    return uuid.uuid4().hex
+
 # Models
+UserRole = Literal["user", "admin"]
+OrderStatus = Literal["pending", "shipped", "delivered"]
+
 class UserBase(BaseModel):
     name: str
     email: EmailStr
-    role: str = "user"  # user or admin
+    role: UserRole = "user"
 
 class UserCreate(UserBase):
     password: str
@@ -49,7 +121,7 @@ class UserLogin(BaseModel):
     password: str
 
 class User(UserBase):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=generate_id)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class UserResponse(BaseModel):
@@ -75,7 +147,7 @@ class ProductCreate(ProductBase):
     pass
 
 class Product(ProductBase):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=generate_id)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class ProductUpdate(BaseModel):
@@ -87,7 +159,8 @@ class ProductUpdate(BaseModel):
 
 class CartItem(BaseModel):
     product_id: str
-    quantity: int
+    # Zero or negative lines would be no-op or stock-raising $inc updates
+    quantity: int = Field(gt=0)
 
 class OrderItem(BaseModel):
     product_id: str
@@ -100,25 +173,38 @@ class OrderCreate(BaseModel):
     delivery_address: str
 
 class Order(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=generate_id)
     user_id: str
     user_name: str
     user_email: str
     items: List[OrderItem]
     total_amount: float
     delivery_address: str
-    status: str = "pending"  # pending, shipped, delivered
+    status: OrderStatus = "pending"
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class OrderUpdate(BaseModel):
-    status: str
+    status: OrderStatus
+
+# Projections: only fetch the fields the response models use
+USER_PROJECTION = {"_id": 0, "id": 1, "name": 1, "email": 1, "role": 1, "created_at": 1}
+PRODUCT_PROJECTION = {
+    "_id": 0, "id": 1, "name": 1, "description": 1, "price": 1,
+    "stock_quantity": 1, "image_url": 1, "created_at": 1
+}
+ORDER_PROJECTION = {
+    "_id": 0, "id": 1, "user_id": 1, "user_name": 1, "user_email": 1, "items": 1,
+    "total_amount": 1, "delivery_address": 1, "status": 1, "created_at": 1
+}
 
 # Utility functions
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password, hashed_password):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, pwd_context.verify, plain_password, hashed_password)
 
-def get_password_hash(password):
-    return pwd_context.hash(password)
+async def get_password_hash(password):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, pwd_context.hash, password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -130,26 +216,46 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+def invalidate_cached_token(token: str):
+    """Drop a token from the auth cache (e.g. on logout or role change)."""
+    _token_cache.pop(_token_cache_key(token), None)
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    cache_key = _token_cache_key(credentials.credentials)
+    cached = _token_cache.get(cache_key)
+    if cached is not None:
+        cached_user, expires_at = cached
+        if expires_at > time.time():
+            return cached_user
+        _token_cache.pop(cache_key, None)
+
     try:
-        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(credentials.credentials, _jwt_verification_key, algorithms=_jwt_algorithms)
         email: str = payload.get("sub")
         if email is None:
             raise credentials_exception
     except jwt.PyJWTError:
         raise credentials_exception
     
-    user = await db.users.find_one({"email": email})
+    user = await db.users.find_one({"email": email}, USER_PROJECTION)
     if user is None:
         raise credentials_exception
-    return User(**user)
-
-async def get_admin_user(current_user: User = Depends(get_current_user)):
+    user_obj = User.model_construct(**user)
+    _token_cache[cache_key] = (user_obj, payload.get("exp", 0))
+    return user_obj
+
+async def get_admin_user(current_user: User = Depends(get_current_user, use_cache=True)):
+    # current_user comes from the token cache on repeat requests, so this is a
+    # pure in-memory role check; use_cache shares it with any other dependency
+    # on get_current_user in the same request
     if current_user.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -157,11 +263,22 @@ async def get_admin_user(current_user: User = Depends(get_current_user)):
         )
     return current_user
 
+async def stream_json_array(cursor, model: Type[BaseModel]) -> AsyncIterator[bytes]:
+    """Yield a JSON array one document at a time as the cursor is iterated."""
+    yield b"["
+    first = True
+    async for document in cursor:
+        if not first:
+            yield b","
+        yield model.model_validate(document).model_dump_json().encode()
+        first = False
+    yield b"]"
+
 # Auth endpoints
 @api_router.post("/auth/register", response_model=Token)
 async def register(user: UserCreate):
     # Check if user exists
-    existing_user = await db.users.find_one({"email": user.email})
+    existing_user = await db.users.find_one({"email": user.email}, {"_id": 1})
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -169,16 +286,25 @@ async def register(user: UserCreate):
         )
     
     # Hash password
-    hashed_password = get_password_hash(user.password)
+    hashed_password = await get_password_hash(user.password)
     
     # Create user
-    user_dict = user.dict()
-    user_dict["password"] = hashed_password
-    user_obj = User(**{k: v for k, v in user_dict.items() if k != "password"})
-    user_dict["id"] = user_obj.id
-    user_dict["created_at"] = user_obj.created_at
-    
-    await db.users.insert_one(user_dict)
+    user_id = generate_id()
+    created_at = datetime.now(timezone.utc)
+    try:
+        await db.users.insert_one({
+            "id": user_id,
+            "name": user.name,
+            "email": user.email,
+            "role": user.role,
+            "password": hashed_password,
+            "created_at": created_at
+        })
+    except DuplicateKeyError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
     
     # Create token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -187,19 +313,19 @@ async def register(user: UserCreate):
     )
     
     user_response = UserResponse(
-        id=user_obj.id,
-        name=user_obj.name,
-        email=user_obj.email,
-        role=user_obj.role,
-        created_at=user_obj.created_at
+        id=user_id,
+        name=user.name,
+        email=user.email,
+        role=user.role,
+        created_at=created_at
     )
     
     return Token(access_token=access_token, token_type="bearer", user=user_response)
 
 @api_router.post("/auth/login", response_model=Token)
 async def login(user_credentials: UserLogin):
-    user = await db.users.find_one({"email": user_credentials.email})
-    if not user or not verify_password(user_credentials.password, user["password"]):
+    user = await db.users.find_one({"email": user_credentials.email}, {"_id": 0})
+    if not user or not await verify_password(user_credentials.password, user["password"]):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -231,70 +357,217 @@ async def get_me(current_user: User = Depends(get_current_user)):
         created_at=current_user.created_at
     )
 
+# Pagination
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+def encode_order_cursor(order: dict) -> str:
+    raw = f"{order['created_at'].isoformat()}|{order['id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_order_cursor(cursor: str):
+    try:
+        created_at, order_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), order_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 # Product endpoints
+MIN_TEXT_SEARCH_LENGTH = 3
+
+def name_prefix_filter(search: str) -> dict:
+    # Case-sensitive and anchored on the lowercased copy of the name, so the
+    # regex is answered from the name_lower index bounds instead of a scan
+    return {"$regex": f"^{re.escape(search.lower())}"}
+
+def product_document(product: Product) -> dict:
+    document = product.model_dump()
+    document["name_lower"] = product.name.lower()
+    return document
+
 @api_router.get("/products", response_model=List[Product])
-async def get_products(search: Optional[str] = None, min_price: Optional[float] = None, max_price: Optional[float] = None):
-    query = {}
-    
-    if search:
-        query["$or"] = [
-            {"name": {"$regex": search, "$options": "i"}},
-            {"description": {"$regex": search, "$options": "i"}}
-        ]
-    
-    if min_price is not None or max_price is not None:
-        price_filter = {}
-        if min_price is not None:
-            price_filter["$gte"] = min_price
-        if max_price is not None:
-            price_filter["$lte"] = max_price
-        query["price"] = price_filter
+async def get_products(
+    search: Optional[str] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    skip: int = Query(0, ge=0)
+):
+    cache_key = (search or "", min_price, max_price, limit, skip)
+    body = _products_cache.get(cache_key)
+    if body is None:
+        query = {}
+        
+        if search:
+            if len(search) < MIN_TEXT_SEARCH_LENGTH:
+                # Too short for the text index to match whole words; fall back to an
+                # anchored prefix match on the name
+                query["name_lower"] = name_prefix_filter(search)
+            else:
+                query["$text"] = {"$search": search}
+        
+        if min_price is not None or max_price is not None:
+            price_filter = {}
+            if min_price is not None:
+                price_filter["$gte"] = min_price
+            if max_price is not None:
+                price_filter["$lte"] = max_price
+            query["price"] = price_filter
+        
+        if "$text" in query:
+            projection = {**PRODUCT_PROJECTION, "score": {"$meta": "textScore"}}
+            # created_at/id break score ties so skip-based pages don't overlap or drop rows
+            cursor = db.products.find(query, projection).sort(
+                [("score", {"$meta": "textScore"}), ("created_at", -1), ("id", -1)]
+            )
+            products = await cursor.skip(skip).limit(limit).to_list(length=limit)
+            if not products and (skip == 0 or await db.products.find_one(query, {"_id": 1}) is None):
+                # $text only matches whole (stemmed) words, so a partially typed
+                # word like "headph" finds nothing; match it as a name prefix instead
+                del query["$text"]
+                query["name_lower"] = name_prefix_filter(search)
+        if "$text" not in query:
+            cursor = db.products.find(query, PRODUCT_PROJECTION).sort([("created_at", -1), ("id", -1)])
+            products = await cursor.skip(skip).limit(limit).to_list(length=limit)
+        # Trusted documents from our own collection, already projected to the
+        # Product fields: serialize them as-is instead of building a Product per row
+        for product in products:
+            product.pop("score", None)
+        body = orjson.dumps(products)
+        _products_cache[cache_key] = body
     
-    products = await db.products.find(query).to_list(length=None)
-    return [Product(**product) for product in products]
+    return Response(content=body, media_type="application/json")
+
+@api_router.get("/products/export")
+async def export_products(current_user: User = Depends(get_admin_user)):
+    cursor = db.products.find({}, PRODUCT_PROJECTION)
+    return StreamingResponse(stream_json_array(cursor, Product), media_type="application/json")
 
 @api_router.get("/products/{product_id}", response_model=Product)
 async def get_product(product_id: str):
-    product = await db.products.find_one({"id": product_id})
+    product = await db.products.find_one({"id": product_id}, PRODUCT_PROJECTION)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
-    return Product(**product)
+    return product
 
 @api_router.post("/products", response_model=Product)
 async def create_product(product: ProductCreate, current_user: User = Depends(get_admin_user)):
-    product_obj = Product(**product.dict())
-    await db.products.insert_one(product_obj.dict())
+    product_obj = Product(**product.model_dump())
+    await db.products.insert_one(product_document(product_obj))
+    _products_cache.clear()
     return product_obj
 
 @api_router.put("/products/{product_id}", response_model=Product)
 async def update_product(product_id: str, product_update: ProductUpdate, current_user: User = Depends(get_admin_user)):
-    update_data = {k: v for k, v in product_update.dict().items() if v is not None}
+    update_data = product_update.model_dump(exclude_none=True)
     if not update_data:
         raise HTTPException(status_code=400, detail="No update data provided")
+    if "name" in update_data:
+        update_data["name_lower"] = update_data["name"].lower()
     
-    result = await db.products.update_one({"id": product_id}, {"$set": update_data})
-    if result.matched_count == 0:
+    updated_product = await db.products.find_one_and_update(
+        {"id": product_id},
+        {"$set": update_data},
+        projection=PRODUCT_PROJECTION,
+        return_document=ReturnDocument.AFTER
+    )
+    if updated_product is None:
         raise HTTPException(status_code=404, detail="Product not found")
     
-    updated_product = await db.products.find_one({"id": product_id})
-    return Product(**updated_product)
+    _products_cache.clear()
+    return updated_product
 
 @api_router.delete("/products/{product_id}")
 async def delete_product(product_id: str, current_user: User = Depends(get_admin_user)):
     result = await db.products.delete_one({"id": product_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Product not found")
+    _products_cache.clear()
     return {"message": "Product deleted successfully"}
 
 # Order endpoints
+async def place_order_in_transaction(order: Order, items: List[CartItem]):
+    # Stock decrements and the order insert commit together or not at all.
+    # with_transaction reruns the callback on TransientTransactionError, e.g. a
+    # write conflict with a concurrent order for the same product.
+    async def place(session):
+        result = await db.products.bulk_write([
+            UpdateOne(
+                {"id": item.product_id, "stock_quantity": {"$gte": item.quantity}},
+                {"$inc": {"stock_quantity": -item.quantity}}
+            )
+            for item in items
+        ], ordered=False, session=session)
+        if result.modified_count != len(items):
+            raise HTTPException(status_code=400, detail="Insufficient stock for one or more items")
+        await db.orders.insert_one(order.model_dump(), session=session)
+    
+    async with await client.start_session() as session:
+        await session.with_transaction(place)
+
+async def place_order_with_reservations(order: Order, items: List[CartItem]):
+    # Fallback for deployments without transactions (standalone mongod). Each
+    # decrement only applies while enough stock remains and tags the product
+    # with a per-line reservation token, so a partial failure can be rolled
+    # back exactly.
+    product_ids = [item.product_id for item in items]
+    reservations = [f"{order.id}:{index}" for index in range(len(items))]
+    result = await db.products.bulk_write([
+        UpdateOne(
+            {"id": item.product_id, "stock_quantity": {"$gte": item.quantity}},
+            {"$inc": {"stock_quantity": -item.quantity}, "$push": {"stock_reservations": token}}
+        )
+        for item, token in zip(items, reservations)
+    ], ordered=False)
+    
+    if result.modified_count != len(reservations):
+        await db.products.bulk_write([
+            UpdateOne(
+                {"id": item.product_id, "stock_reservations": token},
+                {"$inc": {"stock_quantity": item.quantity}}
+            )
+            for item, token in zip(items, reservations)
+        ], ordered=False)
+        await release_stock_reservations(product_ids, reservations)
+        raise HTTPException(status_code=400, detail="Insufficient stock for one or more items")
+    
+    await db.orders.insert_one(order.model_dump())
+    await release_stock_reservations(product_ids, reservations)
+
+async def release_stock_reservations(product_ids: List[str], reservations: List[str]):
+    await db.products.update_many(
+        {"id": {"$in": product_ids}},
+        {"$pull": {"stock_reservations": {"$in": reservations}}}
+    )
+
 @api_router.post("/orders", response_model=Order)
 async def create_order(order_data: OrderCreate, current_user: User = Depends(get_current_user)):
+    if not order_data.items:
+        raise HTTPException(status_code=400, detail="Order must contain at least one item")
+    
+    # Merge repeated lines for the same product so each one is validated and
+    # decremented once against its combined quantity
+    quantities: Dict[str, int] = {}
+    for item in order_data.items:
+        quantities[item.product_id] = quantities.get(item.product_id, 0) + item.quantity
+    items = [CartItem(product_id=product_id, quantity=quantity) for product_id, quantity in quantities.items()]
+    
+    # Fetch every product in the cart with a single query
+    product_ids = list(quantities)
+    products = {
+        product["id"]: product
+        async for product in db.products.find(
+            {"id": {"$in": product_ids}},
+            {"_id": 0, "id": 1, "name": 1, "price": 1, "stock_quantity": 1}
+        )
+    }
+    
     # Validate products and calculate total
     order_items = []
     total_amount = 0
     
-    for item in order_data.items:
-        product = await db.products.find_one({"id": item.product_id})
+    for item in items:
+        product = products.get(item.product_id)
         if not product:
             raise HTTPException(status_code=404, detail=f"Product {item.product_id} not found")
         
@@ -309,12 +582,6 @@ async def create_order(order_data: OrderCreate, current_user: User = Depends(get
         )
         order_items.append(order_item)
         total_amount += product["price"] * item.quantity
-        
-        # Update stock
-        await db.products.update_one(
-            {"id": item.product_id},
-            {"$inc": {"stock_quantity": -item.quantity}}
-        )
     
     # Create order
     order = Order(
@@ -326,21 +593,46 @@ async def create_order(order_data: OrderCreate, current_user: User = Depends(get
         delivery_address=order_data.delivery_address
     )
     
-    await db.orders.insert_one(order.dict())
+    if transactions_supported:
+        await place_order_in_transaction(order, items)
+    else:
+        await place_order_with_reservations(order, items)
+    _products_cache.clear()
     return order
 
 @api_router.get("/orders", response_model=List[Order])
-async def get_orders(current_user: User = Depends(get_current_user)):
-    if current_user.role == "admin":
-        orders = await db.orders.find().to_list(length=None)
-    else:
-        orders = await db.orders.find({"user_id": current_user.id}).to_list(length=None)
+async def get_orders(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
+):
+    query = {} if current_user.role == "admin" else {"user_id": current_user.id}
+    
+    # Keyset pagination on (created_at, id) so deep pages don't pay for skip
+    if after:
+        created_at, order_id = decode_order_cursor(after)
+        query["$or"] = [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "id": {"$lt": order_id}}
+        ]
+    
+    cursor = db.orders.find(query, ORDER_PROJECTION).sort([("created_at", -1), ("id", -1)])
+    orders = await cursor.limit(limit).to_list(length=limit)
     
-    return [Order(**order) for order in orders]
+    if len(orders) == limit:
+        response.headers["X-Next-Cursor"] = encode_order_cursor(orders[-1])
+    
+    return orders
+
+@api_router.get("/orders/export")
+async def export_orders(current_user: User = Depends(get_admin_user)):
+    cursor = db.orders.find({}, ORDER_PROJECTION)
+    return StreamingResponse(stream_json_array(cursor, Order), media_type="application/json")
 
 @api_router.get("/orders/{order_id}", response_model=Order)
 async def get_order(order_id: str, current_user: User = Depends(get_current_user)):
-    order = await db.orders.find_one({"id": order_id})
+    order = await db.orders.find_one({"id": order_id}, ORDER_PROJECTION)
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
     
@@ -348,29 +640,57 @@ async def get_order(order_id: str, current_user: User = Depends(get_current_user
     if current_user.role != "admin" and order["user_id"] != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to view this order")
     
-    return Order(**order)
+    return order
 
 @api_router.put("/orders/{order_id}/status", response_model=Order)
 async def update_order_status(order_id: str, status_update: OrderUpdate, current_user: User = Depends(get_admin_user)):
-    valid_statuses = ["pending", "shipped", "delivered"]
-    if status_update.status not in valid_statuses:
-        raise HTTPException(status_code=400, detail="Invalid status")
-    
-    result = await db.orders.update_one(
+    updated_order = await db.orders.find_one_and_update(
         {"id": order_id},
-        {"$set": {"status": status_update.status}}
+        {"$set": {"status": status_update.status}},
+        projection=ORDER_PROJECTION,
+        return_document=ReturnDocument.AFTER
     )
     
-    if result.matched_count == 0:
+    if updated_order is None:
         raise HTTPException(status_code=404, detail="Order not found")
     
-    updated_order = await db.orders.find_one({"id": order_id})
-    return Order(**updated_order)
+    return updated_order
+
+# Detect whether the deployment supports multi-document transactions
+async def detect_transaction_support():
+    global transactions_supported
+    hello = await client.admin.command("hello")
+    transactions_supported = "setName" in hello or hello.get("msg") == "isdbgrid"
+
+# Create database indexes
+async def create_indexes():
+    await asyncio.gather(
+        db.users.create_index("email", unique=True),
+        db.users.create_index("id", unique=True),
+        db.products.create_index("id", unique=True),
+        db.products.create_index([("name", "text"), ("description", "text")]),
+        db.products.create_index("price"),
+        db.products.create_index("name"),
+        db.products.create_index("name_lower"),
+        db.products.create_index([("created_at", -1), ("id", -1)]),
+        db.orders.create_index("id", unique=True),
+        db.orders.create_index([("created_at", -1), ("id", -1)]),
+        db.orders.create_index([("user_id", 1), ("created_at", -1), ("id", -1)]),
+    )
+
+# Products stored before name_lower existed get it filled in once
+async def backfill_product_name_lower():
+    updates = [
+        UpdateOne({"id": product["id"]}, {"$set": {"name_lower": product["name"].lower()}})
+        async for product in db.products.find({"name_lower": {"$exists": False}}, {"_id": 0, "id": 1, "name": 1})
+    ]
+    if updates:
+        await db.products.bulk_write(updates, ordered=False)
 
 # Create default admin user
 async def create_default_admin():
     admin_email = "admin@shop.com"
-    existing_admin = await db.users.find_one({"email": admin_email})
+    existing_admin = await db.users.find_one({"email": admin_email}, {"_id": 1})
     
     if not existing_admin:
         admin_user = UserCreate(
@@ -380,13 +700,22 @@ async def create_default_admin():
             role="admin"
         )
         
-        hashed_password = get_password_hash(admin_user.password)
-        user_obj = User(**{k: v for k, v in admin_user.dict().items() if k != "password"})
-        user_dict = user_obj.dict()
+        hashed_password = await get_password_hash(admin_user.password)
+        user_obj = User(**admin_user.model_dump(exclude={"password"}))
+        user_dict = user_obj.model_dump(exclude={"email"})
         user_dict["password"] = hashed_password
         
-        await db.users.insert_one(user_dict)
-        print(f"Created default admin user: {admin_email} / admin123")
+        # Several workers can pass the probe on a fresh database; the upsert on
+        # the unique email lets exactly one of them insert
+        result = await db.users.update_one(
+            {"email": admin_email}, {"$setOnInsert": user_dict}, upsert=True
+        )
+        if result.upserted_id is not None:
+            print(f"Created default admin user: {admin_email} / admin123")
+
+def sample_product_id(name: str) -> str:
+    # Deterministic, so every worker seeds a sample product under the same id
+    return uuid.uuid5(uuid.NAMESPACE_URL, f"shophub:sample-product/{name}").hex
 
 # Create sample products
 async def create_sample_products():
@@ -428,11 +757,28 @@ async def create_sample_products():
         }
     ]
     
-    for product_data in sample_products:
-        existing_product = await db.products.find_one({"name": product_data["name"]})
-        if not existing_product:
-            product_obj = Product(**product_data)
-            await db.products.insert_one(product_obj.dict())
+    # One probe for all names; on warm restarts everything exists and we stop here
+    names = [product_data["name"] for product_data in sample_products]
+    existing_names = {
+        product["name"]
+        async for product in db.products.find({"name": {"$in": names}}, {"_id": 0, "name": 1})
+    }
+    missing_products = [
+        product_document(Product(id=sample_product_id(product_data["name"]), **product_data))
+        for product_data in sample_products
+        if product_data["name"] not in existing_names
+    ]
+    if missing_products:
+        # Upserts keyed on the unique id, so workers seeding a fresh database
+        # concurrently can't insert the same sample product twice
+        await db.products.bulk_write([
+            UpdateOne(
+                {"id": product["id"]},
+                {"$setOnInsert": {key: value for key, value in product.items() if key != "id"}},
+                upsert=True
+            )
+            for product in missing_products
+        ], ordered=False)
 
 # Include the router in the main app
 app.include_router(api_router)
@@ -440,9 +786,10 @@ app.include_router(api_router)
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
-    allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
+    allow_origins=CORS_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Configure logging
@@ -451,14 +798,3 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
-
-async def lifespan(app: FastAPI):
-    # Startup logic
-    print("Server is starting...")
-    # You can put your database connection or any setup here
-    yield
-    # Shutdown logic
-    print("Server is shutting down...")
-    # You can close database connections or cleanup here
-
-app = FastAPI(lifespan=lifespan)
@@ -1,11 +1,92 @@
 import requests
+import orjson
+import ijson
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3Error
+from urllib3.util.retry import Retry
 import sys
 import json
+import argparse
+import threading
+import statistics
+from collections import deque
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import time
+import random
+
+# Test dependency graph (run_all_tests follows it):
+#
+#   admin login, user registration -> user login
+#     -> in parallel: get/search/filter products, current user, user/admin
+#        orders, create product (admin), create product (user, forbidden)
+#     -> update product        (needs test_product_id from create product)
+#     -> create order          (needs test_product_id)
+#     -> update order status   (needs test_order_id from create order)
+#     -> delete product        (cleanup)
+#
+# test_product_id comes only from the create-product response; listing
+# products does not set it.
+
+ADMIN_CREDENTIALS = {"email": "admin@shop.com", "password": "admin123"}
+TEST_USER_PASSWORD = "testpass123"
+TEST_DELIVERY_ADDRESS = "123 Test Street, Test City, TC 12345"
+
+# Constant request payloads, serialized once at import instead of on every send
+_ADMIN_LOGIN_BODY = orjson.dumps(ADMIN_CREDENTIALS)
+_NEW_PRODUCT_BODY = orjson.dumps({
+    "name": "Test Product",
+    "description": "A test product created by automated testing",
+    "price": 49.99,
+    "stock_quantity": 10,
+    "image_url": "https://images.unsplash.com/photo-1560472354-b33ff0c44a43?w=500&h=500&fit=crop"
+})
+_FORBIDDEN_PRODUCT_BODY = orjson.dumps({
+    "name": "Unauthorized Product",
+    "description": "This should fail",
+    "price": 99.99,
+    "stock_quantity": 5
+})
+_PRODUCT_UPDATE_BODY = orjson.dumps({"price": 59.99, "stock_quantity": 15})
+_STATUS_UPDATE_BODY = orjson.dumps({"status": "shipped"})
+
+# Concurrent read-only requests in run_all_tests. The default pool of 20
+# connections already covers them; only the load test's pool_size raises it.
+PARALLEL_WORKERS = 8
+
+# List endpoints whose GET bodies are parsed item by item as they arrive
+STREAMED_LIST_ENDPOINTS = ('products', 'orders')
+
+# Attempts per request for errors the adapter's Retry does not handle
+REQUEST_ATTEMPTS = 3
+
+# Methods safe to resend after the server may already have acted on them. A
+# retried POST could create a duplicate and a retried DELETE would see a 404,
+# so those surface their first error instead.
+IDEMPOTENT_METHODS = ('GET', 'PUT')
+
+# Response cache modes:
+#   disabled - every call hits the API
+#   enabled  - GETs are served from the cache when present; all responses are recorded
+#   replay   - every call is served from the cache; a miss raises CacheMissError
+CACHE_MODES = ('disabled', 'enabled', 'replay')
+CACHE_PATH = Path(__file__).with_name('.shophub_cache.json')
+
+# Read-only endpoints hit repeatedly by the load test; also issued once by
+# warmup so cold-cache cost is kept out of the steady-state timings
+LOAD_TEST_ENDPOINTS = (
+    'products',
+    'products?search=headphones',
+    'products?min_price=50&max_price=150',
+)
+
+class CacheMissError(Exception):
+    """Raised in replay mode when no recorded response exists for a request"""
 
 class ShopHubAPITester:
-    def __init__(self, base_url="https://shopmanager-9.preview.emergentagent.com"):
+    def __init__(self, base_url="https://shopmanager-9.preview.emergentagent.com", cache_mode='disabled',
+                 pool_size=PARALLEL_WORKERS, conditional=False, verbose=True):
         self.base_url = base_url
         self.api_url = f"{base_url}/api"
         self.admin_token = None
@@ -15,55 +96,235 @@ class ShopHubAPITester:
         self.test_order_id = None
         self.tests_run = 0
         self.tests_passed = 0
+        self._lock = threading.Lock()
+        # Output is collected here and written in one go by flush_logs
+        self._log_buffer = []
+        # Per-test banners are skipped unless verbose
+        self.verbose = verbose
+        # Request latencies, split by whether the calling thread is warming up
+        self._warmup_times = []
+        self._steady_times = []
+        self._phase = threading.local()
+        
+        if cache_mode not in CACHE_MODES:
+            raise ValueError(f"cache_mode must be one of {CACHE_MODES}")
+        self.cache_mode = cache_mode
+        self._cache = {}
+        if cache_mode != 'disabled':
+            self.load_cache()
+        
+        # One pooled session so every call reuses a kept-alive connection
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=max(20, pool_size),
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=IDEMPOTENT_METHODS,
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({'Content-Type': 'application/json'})
+        self._headers_by_token = {}
+        # Prepared request and send settings per (method, endpoint); see _prepare
+        self._prepared_cache = {}
+        self._order_bodies = {}
+        # With conditional GETs, the last ETag and decoded body seen per cache key
+        self.conditional = conditional
+        self._etags = {}
+
+    def close(self):
+        """Close pooled connections and persist recorded responses"""
+        if self.cache_mode == 'enabled':
+            self.save_cache()
+        self.session.close()
+
+    def load_cache(self):
+        """Load recorded responses from disk"""
+        if CACHE_PATH.exists():
+            self._cache = {key: tuple(value) for key, value in json.loads(CACHE_PATH.read_text()).items()}
+
+    def save_cache(self):
+        """Write recorded responses to disk"""
+        CACHE_PATH.write_text(json.dumps(self._cache))
+
+    def _prepare(self, method, endpoint):
+        """Copy of a request prepared once per (method, endpoint), with its send settings"""
+        key = (method, endpoint)
+        cached = self._prepared_cache.get(key)
+        if cached is None:
+            prepared = self.session.prepare_request(requests.Request(method, f"{self.api_url}/{endpoint}"))
+            settings = self.session.merge_environment_settings(prepared.url, {}, None, None, None)
+            cached = self._prepared_cache[key] = (prepared, settings)
+        return cached[0].copy(), cached[1]
+
+    def _auth_headers(self, token):
+        """Per-token Authorization header, built once and reused for every call"""
+        headers = self._headers_by_token.get(token)
+        if headers is None:
+            headers = self._headers_by_token[token] = {'Authorization': f'Bearer {token}'}
+        return headers
+
+    def _order_body(self, product_id):
+        """Serialized order payload for a product, built once per product id"""
+        body = self._order_bodies.get(product_id)
+        if body is None:
+            body = self._order_bodies[product_id] = orjson.dumps({
+                "items": [{"product_id": product_id, "quantity": 2}],
+                "delivery_address": TEST_DELIVERY_ADDRESS
+            })
+        return body
+
+    def _token_role(self, token):
+        """Name the caller by role so cache keys survive token changes between runs"""
+        if not token:
+            return 'anon'
+        if token == self.admin_token:
+            return 'admin'
+        if token == self.user_token:
+            return 'user'
+        return 'other'
+
+    def _emit(self, message):
+        """Queue a line of output for the next flush"""
+        with self._lock:
+            self._log_buffer.append(f"{message}\n")
+
+    def _banner(self, message):
+        """Queue a per-test heading, only in verbose mode"""
+        if self.verbose:
+            self._emit(f"\n{message}")
+
+    def flush_logs(self):
+        """Write all queued output with a single write"""
+        with self._lock:
+            sys.stdout.write(''.join(self._log_buffer))
+            self._log_buffer.clear()
+        sys.stdout.flush()
+
+    def warmup(self):
+        """Issue the common read queries once so later timings measure the warm path"""
+        self._phase.warming = True
+        try:
+            for endpoint in LOAD_TEST_ENDPOINTS:
+                self.make_request('GET', endpoint)
+        finally:
+            self._phase.warming = False
+
+    def _print_timings(self):
+        """Summarize warmup and steady-state request latencies separately"""
+        for label, timings in (("Warmup", self._warmup_times), ("Steady", self._steady_times)):
+            if timings:
+                print(f"⏱️  {label}: {len(timings)} requests, mean {statistics.fmean(timings) * 1000:.1f} ms, "
+                      f"max {max(timings) * 1000:.1f} ms")
 
     def log_test(self, name, success, details=""):
         """Log test results"""
-        self.tests_run += 1
-        if success:
-            self.tests_passed += 1
-            print(f"✅ {name} - PASSED {details}")
-        else:
-            print(f"❌ {name} - FAILED {details}")
+        with self._lock:
+            self.tests_run += 1
+            if success:
+                self.tests_passed += 1
+                self._log_buffer.append(f"✅ {name} - PASSED {details}\n")
+            else:
+                self._log_buffer.append(f"❌ {name} - FAILED {details}\n")
         return success
 
-    def make_request(self, method, endpoint, data=None, token=None, expected_status=200):
-        """Make HTTP request with error handling"""
-        url = f"{self.api_url}/{endpoint}"
-        headers = {'Content-Type': 'application/json'}
-        
-        if token:
-            headers['Authorization'] = f'Bearer {token}'
+    def make_request(self, method, endpoint, data=None, token=None, expected_status=200, raw_body=None):
+        """Make HTTP request with error handling; raw_body sends pre-serialized JSON bytes as-is"""
+        cache_key = f"{method}|{endpoint}|{self._token_role(token)}"
+        if self.cache_mode == 'replay':
+            if cache_key not in self._cache:
+                raise CacheMissError(f"No recorded response for {cache_key}")
+            status, result_data = self._cache[cache_key]
+            return status == expected_status, status, result_data
+        if self.cache_mode == 'enabled' and method == 'GET' and cache_key in self._cache:
+            status, result_data = self._cache[cache_key]
+            return status == expected_status, status, result_data
 
+        # The prepared request already carries the session's Content-Type: application/json
+        prepared, settings = self._prepare(method, endpoint)
+        if token:
+            prepared.headers.update(self._auth_headers(token))
+        if raw_body is not None:
+            body = raw_body
+        else:
+            body = orjson.dumps(data) if data is not None else None
+        prepared.prepare_body(body, None)
+        stream_list = method == 'GET' and endpoint.split('?', 1)[0] in STREAMED_LIST_ENDPOINTS
+        # Revalidate a previously seen body instead of downloading it again
+        validator = self._etags.get(cache_key) if self.conditional and method == 'GET' else None
+        if validator:
+            prepared.headers['If-None-Match'] = validator[0]
+        
+        timings = self._warmup_times if getattr(self._phase, 'warming', False) else self._steady_times
+        attempts = REQUEST_ATTEMPTS if method in IDEMPOTENT_METHODS else 1
+        started = time.perf_counter()
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=headers, timeout=10)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=headers, timeout=10)
-            elif method == 'PUT':
-                response = requests.put(url, json=data, headers=headers, timeout=10)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=headers, timeout=10)
-            
-            success = response.status_code == expected_status
-            result_data = {}
-            
+            # The adapter retries connection errors and retryable statuses; this loop
+            # covers a body cut off, stalled or corrupted mid-read, which it can't.
+            # Streamed list bodies are read from urllib3 directly, so its errors
+            # (ReadTimeoutError, DecodeError, ProtocolError) arrive untranslated.
+            for attempt in range(attempts):
+                try:
+                    response = self.session.send(prepared, **{**settings, 'stream': stream_list}, timeout=(3, 10))
+                    result_data = self._read_body(response, stream_list)
+                    break
+                except (requests.exceptions.ChunkedEncodingError, requests.exceptions.ContentDecodingError,
+                        Urllib3Error) as e:
+                    if attempt == attempts - 1:
+                        return False, 0, {"error": str(e)}
+                    time.sleep(2 ** attempt * 0.2 + random.random() * 0.1)
+                except requests.exceptions.RequestException as e:
+                    return False, 0, {"error": str(e)}
+        finally:
+            timings.append(time.perf_counter() - started)
+        
+        status = response.status_code
+        if validator and status == 304:
+            status, result_data = 200, validator[1]
+        elif self.conditional and method == 'GET' and status == 200 and 'ETag' in response.headers:
+            self._etags[cache_key] = (response.headers['ETag'], result_data)
+        success = status == expected_status
+        
+        if self.cache_mode == 'enabled':
+            self._cache[cache_key] = (status, result_data)
+        
+        return success, status, result_data
+
+    def _read_body(self, response, stream_list):
+        """Decode a response body, streaming JSON arrays from list endpoints"""
+        if stream_list:
             try:
-                result_data = response.json()
-            except:
-                result_data = {"text": response.text}
-            
-            return success, response.status_code, result_data
-            
-        except requests.exceptions.RequestException as e:
-            return False, 0, {"error": str(e)}
+                if response.status_code == 200:
+                    # Parse items as bytes arrive instead of buffering the whole body
+                    response.raw.decode_content = True
+                    try:
+                        return list(ijson.items(response.raw, 'item', use_float=True))
+                    except ijson.JSONError as e:
+                        # e.g. a proxy error page served with a 200
+                        return {"error": str(e)}
+                content = response.content
+            finally:
+                response.close()
+        else:
+            content = response.content
+        
+        try:
+            return orjson.loads(content) if content else {}
+        except orjson.JSONDecodeError:
+            return {"text": response.text}
 
     def test_admin_login(self):
         """Test admin login with default credentials"""
-        print("\n🔐 Testing Admin Authentication...")
+        self._banner("🔐 Testing Admin Authentication...")
         
         success, status, data = self.make_request(
-            'POST', 'auth/login',
-            {"email": "admin@shop.com", "password": "admin123"}
+            'POST', 'auth/login', raw_body=_ADMIN_LOGIN_BODY
         )
         
         if success and 'access_token' in data:
@@ -76,12 +337,12 @@ class ShopHubAPITester:
 
     def test_user_registration(self):
         """Test user registration"""
-        print("\n👤 Testing User Registration...")
+        self._banner("👤 Testing User Registration...")
         
         user_data = {
             "name": "Test User",
             "email": self.test_user_email,
-            "password": "testpass123",
+            "password": TEST_USER_PASSWORD,
             "role": "user"
         }
         
@@ -99,11 +360,11 @@ class ShopHubAPITester:
 
     def test_user_login(self):
         """Test user login"""
-        print("\n🔑 Testing User Login...")
+        self._banner("🔑 Testing User Login...")
         
         success, status, data = self.make_request(
             'POST', 'auth/login',
-            {"email": self.test_user_email, "password": "testpass123"}
+            {"email": self.test_user_email, "password": TEST_USER_PASSWORD}
         )
         
         if success and 'access_token' in data:
@@ -114,7 +375,7 @@ class ShopHubAPITester:
 
     def test_get_current_user(self):
         """Test getting current user info"""
-        print("\n👥 Testing Get Current User...")
+        self._banner("👥 Testing Get Current User...")
         
         # Test with user token
         success, status, data = self.make_request(
@@ -129,7 +390,7 @@ class ShopHubAPITester:
 
     def test_get_products(self):
         """Test getting products list"""
-        print("\n📦 Testing Get Products...")
+        self._banner("📦 Testing Get Products...")
         
         success, status, data = self.make_request('GET', 'products')
         
@@ -137,7 +398,6 @@ class ShopHubAPITester:
             product_count = len(data)
             if product_count > 0:
                 sample_product = data[0]
-                self.test_product_id = sample_product.get('id')
                 details = f"- Found {product_count} products, Sample: {sample_product.get('name')}"
                 return self.log_test("Get Products", True, details)
             else:
@@ -147,7 +407,7 @@ class ShopHubAPITester:
 
     def test_search_products(self):
         """Test product search functionality"""
-        print("\n🔍 Testing Product Search...")
+        self._banner("🔍 Testing Product Search...")
         
         # Test search by name
         success, status, data = self.make_request('GET', 'products?search=headphones')
@@ -160,7 +420,7 @@ class ShopHubAPITester:
 
     def test_filter_products_by_price(self):
         """Test product price filtering"""
-        print("\n💰 Testing Product Price Filter...")
+        self._banner("💰 Testing Product Price Filter...")
         
         # Test price range filter
         success, status, data = self.make_request('GET', 'products?min_price=50&max_price=150')
@@ -173,18 +433,10 @@ class ShopHubAPITester:
 
     def test_create_product_admin(self):
         """Test creating a new product (admin only)"""
-        print("\n➕ Testing Create Product (Admin)...")
-        
-        new_product = {
-            "name": "Test Product",
-            "description": "A test product created by automated testing",
-            "price": 49.99,
-            "stock_quantity": 10,
-            "image_url": "https://images.unsplash.com/photo-1560472354-b33ff0c44a43?w=500&h=500&fit=crop"
-        }
+        self._banner("➕ Testing Create Product (Admin)...")
         
         success, status, data = self.make_request(
-            'POST', 'products', new_product, token=self.admin_token, expected_status=200
+            'POST', 'products', raw_body=_NEW_PRODUCT_BODY, token=self.admin_token, expected_status=200
         )
         
         if success and 'id' in data:
@@ -196,17 +448,10 @@ class ShopHubAPITester:
 
     def test_create_product_user_forbidden(self):
         """Test that regular users cannot create products"""
-        print("\n🚫 Testing Create Product (User - Should Fail)...")
-        
-        new_product = {
-            "name": "Unauthorized Product",
-            "description": "This should fail",
-            "price": 99.99,
-            "stock_quantity": 5
-        }
+        self._banner("🚫 Testing Create Product (User - Should Fail)...")
         
         success, status, data = self.make_request(
-            'POST', 'products', new_product, token=self.user_token, expected_status=403
+            'POST', 'products', raw_body=_FORBIDDEN_PRODUCT_BODY, token=self.user_token, expected_status=403
         )
         
         if success:  # Success means we got the expected 403 status
@@ -216,18 +461,13 @@ class ShopHubAPITester:
 
     def test_update_product_admin(self):
         """Test updating a product (admin only)"""
-        print("\n✏️ Testing Update Product (Admin)...")
+        self._banner("✏️ Testing Update Product (Admin)...")
         
         if not self.test_product_id:
             return self.log_test("Update Product (Admin)", False, "No test product ID available")
         
-        update_data = {
-            "price": 59.99,
-            "stock_quantity": 15
-        }
-        
         success, status, data = self.make_request(
-            'PUT', f'products/{self.test_product_id}', update_data, 
+            'PUT', f'products/{self.test_product_id}', raw_body=_PRODUCT_UPDATE_BODY,
             token=self.admin_token, expected_status=200
         )
         
@@ -239,23 +479,14 @@ class ShopHubAPITester:
 
     def test_create_order(self):
         """Test creating an order"""
-        print("\n🛒 Testing Create Order...")
+        self._banner("🛒 Testing Create Order...")
         
         if not self.test_product_id:
             return self.log_test("Create Order", False, "No test product ID available")
         
-        order_data = {
-            "items": [
-                {
-                    "product_id": self.test_product_id,
-                    "quantity": 2
-                }
-            ],
-            "delivery_address": "123 Test Street, Test City, TC 12345"
-        }
-        
         success, status, data = self.make_request(
-            'POST', 'orders', order_data, token=self.user_token, expected_status=200
+            'POST', 'orders', raw_body=self._order_body(self.test_product_id),
+            token=self.user_token, expected_status=200
         )
         
         if success and 'id' in data:
@@ -267,7 +498,7 @@ class ShopHubAPITester:
 
     def test_get_orders_user(self):
         """Test getting user's orders"""
-        print("\n📋 Testing Get Orders (User)...")
+        self._banner("📋 Testing Get Orders (User)...")
         
         success, status, data = self.make_request(
             'GET', 'orders', token=self.user_token
@@ -282,7 +513,7 @@ class ShopHubAPITester:
 
     def test_get_orders_admin(self):
         """Test getting all orders (admin)"""
-        print("\n📊 Testing Get Orders (Admin)...")
+        self._banner("📊 Testing Get Orders (Admin)...")
         
         success, status, data = self.make_request(
             'GET', 'orders', token=self.admin_token
@@ -297,15 +528,13 @@ class ShopHubAPITester:
 
     def test_update_order_status(self):
         """Test updating order status (admin only)"""
-        print("\n📦 Testing Update Order Status (Admin)...")
+        self._banner("📦 Testing Update Order Status (Admin)...")
         
         if not self.test_order_id:
             return self.log_test("Update Order Status", False, "No test order ID available")
         
-        status_update = {"status": "shipped"}
-        
         success, status, data = self.make_request(
-            'PUT', f'orders/{self.test_order_id}/status', status_update,
+            'PUT', f'orders/{self.test_order_id}/status', raw_body=_STATUS_UPDATE_BODY,
             token=self.admin_token, expected_status=200
         )
         
@@ -317,7 +546,7 @@ class ShopHubAPITester:
 
     def test_delete_product_admin(self):
         """Test deleting a product (admin only)"""
-        print("\n🗑️ Testing Delete Product (Admin)...")
+        self._banner("🗑️ Testing Delete Product (Admin)...")
         
         if not self.test_product_id:
             return self.log_test("Delete Product (Admin)", False, "No test product ID available")
@@ -340,39 +569,51 @@ class ShopHubAPITester:
         
         # Authentication Tests
         if not self.test_admin_login():
-            print("❌ Admin login failed - stopping tests")
+            self._emit("❌ Admin login failed - stopping tests")
             return False
             
         if not self.test_user_registration():
-            print("❌ User registration failed - stopping tests")
+            self._emit("❌ User registration failed - stopping tests")
             return False
             
         if not self.test_user_login():
-            print("❌ User login failed - stopping tests")
+            self._emit("❌ User login failed - stopping tests")
             return False
+        
+        self.warmup()
+        # Steady-state timings start here; the bcrypt-bound auth calls above are cold
+        self._steady_times.clear()
             
-        self.test_get_current_user()
-        
-        # Product Tests
-        self.test_get_products()
-        self.test_search_products()
-        self.test_filter_products_by_price()
-        self.test_create_product_admin()
-        self.test_create_product_user_forbidden()
+        # Read-only tests and product creation are independent of each other;
+        # overlap their round-trips
+        parallel_tests = [
+            self.test_get_products,
+            self.test_search_products,
+            self.test_filter_products_by_price,
+            self.test_get_current_user,
+            self.test_get_orders_user,
+            self.test_get_orders_admin,
+            self.test_create_product_admin,
+            self.test_create_product_user_forbidden,
+        ]
+        with ThreadPoolExecutor(max_workers=PARALLEL_WORKERS) as executor:
+            list(executor.map(lambda test: test(), parallel_tests))
+        
+        # Tests that depend on the created product stay on the main thread
         self.test_update_product_admin()
         
         # Order Tests
         self.test_create_order()
-        self.test_get_orders_user()
-        self.test_get_orders_admin()
         self.test_update_order_status()
         
         # Cleanup
         self.test_delete_product_admin()
         
         # Results
+        self.flush_logs()
         print("\n" + "=" * 60)
         print(f"📊 TEST RESULTS: {self.tests_passed}/{self.tests_run} tests passed")
+        self._print_timings()
         
         if self.tests_passed == self.tests_run:
             print("🎉 ALL TESTS PASSED! Backend is working correctly.")
@@ -382,9 +623,95 @@ class ShopHubAPITester:
             print(f"⚠️  {failed_tests} tests failed. Check the issues above.")
             return False
 
+    def run_load_test(self, workers=24, duration_s=600):
+        """Hammer the read-only product endpoints from many threads and report latency"""
+        print(f"🔥 Load testing {self.base_url} with {workers} workers for {duration_s}s...")
+        
+        if not self.test_admin_login():
+            self._emit("❌ Admin login failed - stopping load test")
+            return False
+        self.flush_logs()
+        
+        errors = deque()
+        window = {}
+        
+        def start_window():
+            # Runs once every worker has warmed up; only requests after this count
+            self._steady_times.clear()
+            window['started_at'] = time.monotonic()
+            window['deadline'] = window['started_at'] + duration_s
+        
+        ready = threading.Barrier(workers, action=start_window)
+        
+        def worker():
+            try:
+                self.warmup()
+            except BaseException:
+                # Release the workers already waiting instead of leaving them blocked
+                ready.abort()
+                raise
+            try:
+                ready.wait()
+            except threading.BrokenBarrierError:
+                # Another worker failed its warmup and re-raises the cause
+                return
+            while time.monotonic() < window['deadline']:
+                for endpoint in LOAD_TEST_ENDPOINTS:
+                    success, status, _ = self.make_request('GET', endpoint)
+                    if not success:
+                        errors.append(status)
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(worker) for _ in range(workers)]
+            for future in futures:
+                future.result()
+        
+        elapsed = time.monotonic() - window['started_at']
+        latencies = self._steady_times
+        total = len(latencies)
+        if total < 2:
+            print("❌ Too few requests completed to report latency")
+            return False
+        
+        percentiles = statistics.quantiles(latencies, n=100)
+        print("\n" + "=" * 60)
+        print(f"📊 LOAD TEST: {total} requests, {total / elapsed:.1f} req/s")
+        print(f"   p50 {percentiles[49] * 1000:.1f} ms | p95 {percentiles[94] * 1000:.1f} ms | "
+              f"p99 {percentiles[98] * 1000:.1f} ms")
+        print(f"   error rate {len(errors) / total:.2%}")
+        self._print_timings()
+        return not errors
+
 def main():
-    tester = ShopHubAPITester()
-    success = tester.run_all_tests()
+    parser = argparse.ArgumentParser(description="ShopHub backend API tests")
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument('--cache', action='store_true',
+                             help=f"serve repeated GETs from {CACHE_PATH.name} and record responses to it")
+    cache_group.add_argument('--replay', action='store_true',
+                             help=f"answer every request from {CACHE_PATH.name}; fail on a miss")
+    parser.add_argument('--load', type=int, metavar='N',
+                        help="run a load test with N worker threads instead of the functional tests")
+    parser.add_argument('--duration', type=int, default=600, metavar='S',
+                        help="load test duration in seconds (default: 600)")
+    parser.add_argument('--conditional', action='store_true',
+                        help="revalidate repeated GETs with If-None-Match and reuse the body on 304")
+    parser.add_argument('--quiet', action='store_true',
+                        help="skip per-test banners; print only results and the summary")
+    args = parser.parse_args()
+    if args.load and (args.cache or args.replay):
+        parser.error("--load measures the live API and cannot be combined with --cache or --replay")
+    
+    cache_mode = 'replay' if args.replay else 'enabled' if args.cache else 'disabled'
+    tester = ShopHubAPITester(cache_mode=cache_mode, pool_size=args.load or PARALLEL_WORKERS,
+                              conditional=args.conditional, verbose=not (args.quiet or args.load))
+    try:
+        if args.load:
+            success = tester.run_load_test(workers=args.load, duration_s=args.duration)
+        else:
+            success = tester.run_all_tests()
+    finally:
+        tester.flush_logs()
+        tester.close()
     return 0 if success else 1
 
 if __name__ == "__main__":
@@ -20,6 +20,32 @@ import './App.css';
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
 
+// The list endpoints are paginated; pages are loaded one at a time on demand
+const PAGE_SIZE = 50;
+
+const fetchProductsPage = async (filters, skip = 0) => {
+  const params = new URLSearchParams(filters);
+  params.set('limit', PAGE_SIZE);
+  params.set('skip', skip);
+  const response = await axios.get(`${API}/products?${params}`);
+  return { items: response.data, hasMore: response.data.length === PAGE_SIZE };
+};
+
+const fetchOrdersPage = async (after = null) => {
+  const params = new URLSearchParams({ limit: PAGE_SIZE });
+  if (after) params.set('after', after);
+  const response = await axios.get(`${API}/orders?${params}`);
+  return { items: response.data, nextCursor: response.headers['x-next-cursor'] || null };
+};
+
+const LoadMoreButton = ({ onClick, loading }) => (
+  <div className="text-center mt-6">
+    <Button variant="outline" onClick={onClick} disabled={loading}>
+      {loading ? 'Loading...' : 'Load more'}
+    </Button>
+  </div>
+);
+
 // Auth Context
 const AuthContext = createContext();
 
@@ -550,20 +576,26 @@ const Products = () => {
   const { dispatch } = useCart();
   const { toast } = useToast();
   const [products, setProducts] = React.useState([]);
+  const [hasMore, setHasMore] = React.useState(false);
   const [loading, setLoading] = React.useState(true);
+  const [loadingMore, setLoadingMore] = React.useState(false);
   const [search, setSearch] = React.useState('');
   const [minPrice, setMinPrice] = React.useState('');
   const [maxPrice, setMaxPrice] = React.useState('');
 
+  const filters = () => {
+    const params = new URLSearchParams();
+    if (search) params.append('search', search);
+    if (minPrice) params.append('min_price', minPrice);
+    if (maxPrice) params.append('max_price', maxPrice);
+    return params;
+  };
+
   const fetchProducts = async () => {
     try {
-      const params = new URLSearchParams();
-      if (search) params.append('search', search);
-      if (minPrice) params.append('min_price', minPrice);
-      if (maxPrice) params.append('max_price', maxPrice);
-      
-      const response = await axios.get(`${API}/products?${params}`);
-      setProducts(response.data);
+      const page = await fetchProductsPage(filters());
+      setProducts(page.items);
+      setHasMore(page.hasMore);
     } catch (error) {
       toast({ 
         title: "Error", 
@@ -575,6 +607,23 @@ const Products = () => {
     }
   };
 
+  const loadMoreProducts = async () => {
+    setLoadingMore(true);
+    try {
+      const page = await fetchProductsPage(filters(), products.length);
+      setProducts([...products, ...page.items]);
+      setHasMore(page.hasMore);
+    } catch (error) {
+      toast({ 
+        title: "Error", 
+        description: "Failed to load more products",
+        variant: "destructive" 
+      });
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   React.useEffect(() => {
     fetchProducts();
   }, [search, minPrice, maxPrice]);
@@ -670,6 +719,7 @@ const Products = () => {
           ))}
         </div>
       )}
+      {hasMore && <LoadMoreButton onClick={loadMoreProducts} loading={loadingMore} />}
     </div>
   );
 };
@@ -848,13 +898,16 @@ const Orders = () => {
   const { state } = useAuth();
   const { toast } = useToast();
   const [orders, setOrders] = React.useState([]);
+  const [nextCursor, setNextCursor] = React.useState(null);
   const [loading, setLoading] = React.useState(true);
+  const [loadingMore, setLoadingMore] = React.useState(false);
 
   React.useEffect(() => {
     const fetchOrders = async () => {
       try {
-        const response = await axios.get(`${API}/orders`);
-        setOrders(response.data);
+        const page = await fetchOrdersPage();
+        setOrders(page.items);
+        setNextCursor(page.nextCursor);
       } catch (error) {
         toast({ 
           title: "Error", 
@@ -872,6 +925,23 @@ const Orders = () => {
     }
   }, [state.token]);
 
+  const loadMoreOrders = async () => {
+    setLoadingMore(true);
+    try {
+      const page = await fetchOrdersPage(nextCursor);
+      setOrders([...orders, ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      toast({ 
+        title: "Error", 
+        description: "Failed to load more orders",
+        variant: "destructive" 
+      });
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   if (!state.isAuthenticated) {
     return (
       <div className="container mx-auto px-4 py-8 text-center">
@@ -953,6 +1023,7 @@ const Orders = () => {
           ))}
         </div>
       )}
+      {nextCursor && <LoadMoreButton onClick={loadMoreOrders} loading={loadingMore} />}
     </div>
   );
 };
@@ -961,8 +1032,11 @@ const Admin = () => {
   const { state } = useAuth();
   const { toast } = useToast();
   const [products, setProducts] = React.useState([]);
+  const [productsHasMore, setProductsHasMore] = React.useState(false);
   const [orders, setOrders] = React.useState([]);
+  const [ordersCursor, setOrdersCursor] = React.useState(null);
   const [loading, setLoading] = React.useState(true);
+  const [loadingMore, setLoadingMore] = React.useState(false);
   const [editingProduct, setEditingProduct] = React.useState(null);
   const [newProduct, setNewProduct] = React.useState({
     name: '', description: '', price: '', stock_quantity: '', image_url: ''
@@ -977,12 +1051,14 @@ const Admin = () => {
 
   const fetchData = async () => {
     try {
-      const [productsRes, ordersRes] = await Promise.all([
-        axios.get(`${API}/products`),
-        axios.get(`${API}/orders`)
+      const [productsPage, ordersPage] = await Promise.all([
+        fetchProductsPage(),
+        fetchOrdersPage()
       ]);
-      setProducts(productsRes.data);
-      setOrders(ordersRes.data);
+      setProducts(productsPage.items);
+      setProductsHasMore(productsPage.hasMore);
+      setOrders(ordersPage.items);
+      setOrdersCursor(ordersPage.nextCursor);
     } catch (error) {
       toast({ 
         title: "Error", 
@@ -994,6 +1070,40 @@ const Admin = () => {
     }
   };
 
+  const loadMoreProducts = async () => {
+    setLoadingMore(true);
+    try {
+      const page = await fetchProductsPage(undefined, products.length);
+      setProducts([...products, ...page.items]);
+      setProductsHasMore(page.hasMore);
+    } catch (error) {
+      toast({ 
+        title: "Error", 
+        description: "Failed to load more products",
+        variant: "destructive" 
+      });
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  const loadMoreOrders = async () => {
+    setLoadingMore(true);
+    try {
+      const page = await fetchOrdersPage(ordersCursor);
+      setOrders([...orders, ...page.items]);
+      setOrdersCursor(page.nextCursor);
+    } catch (error) {
+      toast({ 
+        title: "Error", 
+        description: "Failed to load more orders",
+        variant: "destructive" 
+      });
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleCreateProduct = async (e) => {
     e.preventDefault();
     try {
@@ -1016,9 +1126,10 @@ const Admin = () => {
 
   const handleUpdateOrderStatus = async (orderId, status) => {
     try {
-      await axios.put(`${API}/orders/${orderId}/status`, { status });
+      const response = await axios.put(`${API}/orders/${orderId}/status`, { status });
       toast({ title: "Order status updated!" });
-      fetchData();
+      // Update in place so orders loaded from later pages stay on screen
+      setOrders(orders.map((order) => (order.id === orderId ? response.data : order)));
     } catch (error) {
       toast({ 
         title: "Error", 
@@ -1032,7 +1143,7 @@ const Admin = () => {
     try {
       await axios.delete(`${API}/products/${productId}`);
       toast({ title: "Product deleted successfully!" });
-      fetchData();
+      setProducts(products.filter((product) => product.id !== productId));
     } catch (error) {
       toast({ 
         title: "Error", 
@@ -1162,6 +1273,7 @@ const Admin = () => {
                   </div>
                 ))}
               </div>
+              {productsHasMore && <LoadMoreButton onClick={loadMoreProducts} loading={loadingMore} />}
             </CardContent>
           </Card>
         </TabsContent>
@@ -1212,6 +1324,7 @@ const Admin = () => {
                   </div>
                 ))}
               </div>
+              {ordersCursor && <LoadMoreButton onClick={loadMoreOrders} loading={loadingMore} />}
             </CardContent>
           </Card>
         </TabsContent>
@@ -1223,7 +1336,7 @@ const Admin = () => {
                 <CardTitle className="text-lg">Total Products</CardTitle>
               </CardHeader>
               <CardContent>
-                <p className="text-3xl font-bold text-orange-600">{products.length}</p>
+                <p className="text-3xl font-bold text-orange-600">{products.length}{productsHasMore && '+'}</p>
               </CardContent>
             </Card>
             <Card>
@@ -1231,7 +1344,7 @@ const Admin = () => {
                 <CardTitle className="text-lg">Total Orders</CardTitle>
               </CardHeader>
               <CardContent>
-                <p className="text-3xl font-bold text-green-600">{orders.length}</p>
+                <p className="text-3xl font-bold text-green-600">{orders.length}{ordersCursor && '+'}</p>
               </CardContent>
             </Card>
             <Card>
@@ -1242,6 +1355,7 @@ const Admin = () => {
                 <p className="text-3xl font-bold text-blue-600">
                   ${orders.reduce((sum, order) => sum + order.total_amount, 0).toFixed(2)}
                 </p>
+                {ordersCursor && <p className="text-sm text-gray-500">From loaded orders</p>}
               </CardContent>
             </Card>
           </div>
@@ -0,0 +1,84 @@
+"""Fixtures for the live ShopHub API tests.
+
+The tests in test_api.py run against a deployed backend and are skipped unless
+SHOPHUB_BASE_URL is set; the other test modules run offline. Read-only tests spread across workers with
+pytest-xdist; mutating tests share one xdist group so they run on a single
+worker:
+
+    SHOPHUB_BASE_URL=https://... pytest tests -n 8 --dist=loadgroup
+"""
+import os
+import uuid
+
+import pytest
+
+from backend_test import ADMIN_CREDENTIALS, TEST_DELIVERY_ADDRESS, TEST_USER_PASSWORD, ShopHubAPITester
+
+
+def pytest_configure(config):
+    # Registered here too so the marker is known when xdist is not installed
+    config.addinivalue_line("markers", "xdist_group(name): run tests in the same group on one xdist worker")
+
+
+@pytest.fixture(scope="session")
+def api():
+    base_url = os.environ.get("SHOPHUB_BASE_URL")
+    if not base_url:
+        pytest.skip("SHOPHUB_BASE_URL not set")
+    # Each xdist worker process gets its own session and connection pool
+    tester = ShopHubAPITester(base_url=base_url)
+    yield tester
+    tester.close()
+
+
+@pytest.fixture(scope="session")
+def admin_token(api):
+    success, status, data = api.make_request('POST', 'auth/login', ADMIN_CREDENTIALS)
+    assert success, f"Admin login failed: {status} {data}"
+    api.admin_token = data['access_token']
+    return api.admin_token
+
+
+@pytest.fixture(scope="session")
+def test_user(api):
+    user = {
+        "name": "Test User",
+        "email": f"pytest_{uuid.uuid4().hex[:12]}@test.com",
+        "password": TEST_USER_PASSWORD,
+        "role": "user",
+    }
+    success, status, data = api.make_request('POST', 'auth/register', user)
+    assert success, f"User registration failed: {status} {data}"
+    return {**user, "token": data['access_token']}
+
+
+@pytest.fixture(scope="session")
+def user_token(api, test_user):
+    api.user_token = test_user["token"]
+    return api.user_token
+
+
+@pytest.fixture
+def product(api, admin_token):
+    new_product = {
+        "name": "Test Product",
+        "description": "A test product created by automated testing",
+        "price": 49.99,
+        "stock_quantity": 10,
+        "image_url": "https://images.unsplash.com/photo-1560472354-b33ff0c44a43?w=500&h=500&fit=crop",
+    }
+    success, status, data = api.make_request('POST', 'products', new_product, token=admin_token)
+    assert success, f"Create product failed: {status} {data}"
+    yield data
+    api.make_request('DELETE', f"products/{data['id']}", token=admin_token)
+
+
+@pytest.fixture
+def order(api, user_token, product):
+    order_data = {
+        "items": [{"product_id": product['id'], "quantity": 2}],
+        "delivery_address": TEST_DELIVERY_ADDRESS,
+    }
+    success, status, data = api.make_request('POST', 'orders', order_data, token=user_token)
+    assert success, f"Create order failed: {status} {data}"
+    return data
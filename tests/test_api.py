@@ -0,0 +1,114 @@
+import pytest
+
+from backend_test import ADMIN_CREDENTIALS, TEST_USER_PASSWORD
+
+# Tests that create, change or delete data run together on one xdist worker
+writes = pytest.mark.xdist_group("writes")
+
+
+def test_admin_login(api):
+    success, status, data = api.make_request('POST', 'auth/login', ADMIN_CREDENTIALS)
+    assert success, f"Status: {status}, Data: {data}"
+    assert 'access_token' in data
+    assert data['user']['role'] == 'admin'
+
+
+def test_user_registration(test_user):
+    assert test_user['token']
+
+
+def test_user_login(api, test_user):
+    success, status, data = api.make_request(
+        'POST', 'auth/login', {"email": test_user['email'], "password": TEST_USER_PASSWORD}
+    )
+    assert success, f"Status: {status}"
+    assert 'access_token' in data
+
+
+def test_get_current_user(api, test_user, user_token):
+    success, status, data = api.make_request('GET', 'auth/me', token=user_token)
+    assert success, f"Status: {status}"
+    assert data['email'] == test_user['email']
+    assert data['role'] == 'user'
+
+
+def test_get_products(api):
+    success, status, data = api.make_request('GET', 'products')
+    assert success, f"Status: {status}"
+    assert isinstance(data, list)
+    assert data, "No products found"
+
+
+def test_search_products(api):
+    success, status, data = api.make_request('GET', 'products?search=headphones')
+    assert success, f"Status: {status}"
+    assert isinstance(data, list)
+
+
+def test_filter_products_by_price(api):
+    success, status, data = api.make_request('GET', 'products?min_price=50&max_price=150')
+    assert success, f"Status: {status}"
+    assert isinstance(data, list)
+    assert all(50 <= product['price'] <= 150 for product in data)
+
+
+def test_get_orders_user(api, user_token):
+    success, status, data = api.make_request('GET', 'orders', token=user_token)
+    assert success, f"Status: {status}"
+    assert isinstance(data, list)
+
+
+def test_get_orders_admin(api, admin_token):
+    success, status, data = api.make_request('GET', 'orders', token=admin_token)
+    assert success, f"Status: {status}"
+    assert isinstance(data, list)
+
+
+def test_create_product_user_forbidden(api, user_token):
+    new_product = {
+        "name": "Unauthorized Product",
+        "description": "This should fail",
+        "price": 99.99,
+        "stock_quantity": 5,
+    }
+    success, status, _ = api.make_request(
+        'POST', 'products', new_product, token=user_token, expected_status=403
+    )
+    assert success, f"Expected 403, got {status}"
+
+
+@writes
+def test_create_product_admin(product):
+    assert product['id']
+    assert product['name'] == "Test Product"
+
+
+@writes
+def test_update_product_admin(api, admin_token, product):
+    success, status, data = api.make_request(
+        'PUT', f"products/{product['id']}", {"price": 59.99, "stock_quantity": 15}, token=admin_token
+    )
+    assert success, f"Status: {status}"
+    assert data['price'] == 59.99
+    assert data['stock_quantity'] == 15
+
+
+@writes
+def test_create_order(order, product):
+    assert order['id']
+    assert order['total_amount'] == pytest.approx(product['price'] * 2)
+
+
+@writes
+def test_update_order_status(api, admin_token, order):
+    success, status, data = api.make_request(
+        'PUT', f"orders/{order['id']}/status", {"status": "shipped"}, token=admin_token
+    )
+    assert success, f"Status: {status}"
+    assert data['status'] == 'shipped'
+
+
+@writes
+def test_delete_product_admin(api, admin_token, product):
+    success, status, _ = api.make_request('DELETE', f"products/{product['id']}", token=admin_token)
+    assert success, f"Status: {status}"
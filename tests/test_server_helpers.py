@@ -0,0 +1,63 @@
+import base64
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# server.py reads its Mongo settings at import; the client connects lazily, so
+# these helpers can be exercised without a database
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "shophub_test")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from fastapi import HTTPException  # noqa: E402
+from pydantic import ValidationError  # noqa: E402
+from server import (  # noqa: E402
+    CartItem,
+    Product,
+    decode_order_cursor,
+    encode_order_cursor,
+    name_prefix_filter,
+    product_document,
+)
+
+
+def test_order_cursor_round_trip():
+    created_at = datetime(2024, 5, 1, 12, 30, 15, 250000)
+    cursor = encode_order_cursor({"created_at": created_at, "id": "abc123"})
+    assert decode_order_cursor(cursor) == (created_at, "abc123")
+
+
+def _encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    _encode(b"2024-05-01T12:30:15"),
+    _encode(b"yesterday|abc123"),
+    _encode(b"\xff\xfe|abc123"),
+])
+def test_decode_order_cursor_rejects_malformed(cursor):
+    with pytest.raises(HTTPException) as excinfo:
+        decode_order_cursor(cursor)
+    assert excinfo.value.status_code == 400
+
+
+def test_name_prefix_filter_is_anchored_lowercase_and_escaped():
+    assert name_prefix_filter("Hea.d") == {"$regex": r"^hea\.d"}
+
+
+def test_product_document_stores_lowercased_name():
+    product = Product(name="Wireless Headphones", description="d", price=1.0, stock_quantity=1)
+    document = product_document(product)
+    assert document["name_lower"] == "wireless headphones"
+    assert document["name"] == "Wireless Headphones"
+
+
+@pytest.mark.parametrize("quantity", [0, -1])
+def test_cart_item_rejects_non_positive_quantity(quantity):
+    with pytest.raises(ValidationError):
+        CartItem(product_id="p1", quantity=quantity)
@@ -0,0 +1,183 @@
+import io
+import socket
+
+import orjson
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from urllib3 import HTTPResponse
+
+from backend_test import CacheMissError, ShopHubAPITester
+
+
+def canned_response(status, body=b"", headers=None):
+    return canned_stream(status, io.BytesIO(body), headers)
+
+
+def canned_stream(status, body, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response.raw = HTTPResponse(body=body, status=status, headers=headers, preload_content=False)
+    return response
+
+
+class StalledBody(io.RawIOBase):
+    """A body whose read times out, like a server that stops sending mid-response"""
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        raise socket.timeout("timed out")
+
+
+class CannedAdapter(BaseAdapter):
+    """Answers every request with the next queued response and records what was sent"""
+
+    def __init__(self, *responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def make_tester(adapter, **kwargs):
+    tester = ShopHubAPITester(base_url="http://shophub.test", **kwargs)
+    tester.session.mount("http://", adapter)
+    return tester
+
+
+@pytest.fixture
+def replay_tester():
+    tester = ShopHubAPITester(base_url="http://shophub.test", cache_mode='replay')
+    tester._cache = {"GET|products|anon": (200, [{"id": "p1"}])}
+    return tester
+
+
+def test_replay_serves_recorded_response(replay_tester):
+    assert replay_tester.make_request('GET', 'products') == (True, 200, [{"id": "p1"}])
+
+
+def test_replay_checks_expected_status(replay_tester):
+    success, status, _ = replay_tester.make_request('GET', 'products', expected_status=404)
+    assert not success
+    assert status == 200
+
+
+def test_replay_raises_on_miss(replay_tester):
+    with pytest.raises(CacheMissError):
+        replay_tester.make_request('GET', 'orders')
+
+
+def test_invalid_cache_mode_rejected():
+    with pytest.raises(ValueError):
+        ShopHubAPITester(cache_mode='sometimes')
+
+
+def test_read_body_streams_list():
+    tester = ShopHubAPITester()
+    response = canned_response(200, b'[{"id": "p1", "price": 9.5}, {"id": "p2", "price": 20}]')
+    assert tester._read_body(response, stream_list=True) == [
+        {"id": "p1", "price": 9.5}, {"id": "p2", "price": 20.0}
+    ]
+
+
+def test_read_body_streamed_non_json_is_an_error():
+    tester = ShopHubAPITester()
+    data = tester._read_body(canned_response(200, b"<html>maintenance</html>"), stream_list=True)
+    assert set(data) == {"error"}
+
+
+@pytest.mark.parametrize("body, stream_list, expected", [
+    (b'{"detail": "Not found"}', True, {"detail": "Not found"}),
+    (b'{"id": "u1"}', False, {"id": "u1"}),
+    (b"", False, {}),
+    (b"Bad Gateway", False, {"text": "Bad Gateway"}),
+])
+def test_read_body_buffered(body, stream_list, expected):
+    tester = ShopHubAPITester()
+    status = 404 if stream_list else 200
+    assert tester._read_body(canned_response(status, body), stream_list) == expected
+
+
+def test_conditional_get_reuses_body_on_304():
+    products = [{"id": "p1"}]
+    adapter = CannedAdapter(
+        canned_response(200, orjson.dumps(products), {"ETag": '"v1"'}),
+        canned_response(304),
+    )
+    tester = make_tester(adapter, conditional=True)
+
+    assert tester.make_request('GET', 'products') == (True, 200, products)
+    assert tester.make_request('GET', 'products') == (True, 200, products)
+    assert 'If-None-Match' not in adapter.sent[0].headers
+    assert adapter.sent[1].headers['If-None-Match'] == '"v1"'
+
+
+def test_conditional_get_is_opt_in():
+    adapter = CannedAdapter(
+        canned_response(200, b"[]", {"ETag": '"v1"'}),
+        canned_response(200, b"[]", {"ETag": '"v1"'}),
+    )
+    tester = make_tester(adapter)
+    tester.make_request('GET', 'products')
+    tester.make_request('GET', 'products')
+    assert 'If-None-Match' not in adapter.sent[1].headers
+
+
+def test_interrupted_get_is_retried():
+    adapter = CannedAdapter(
+        requests.exceptions.ChunkedEncodingError("connection broken"),
+        canned_response(200, b'{"id": "u1"}'),
+    )
+    tester = make_tester(adapter)
+    assert tester.make_request('GET', 'auth/me') == (True, 200, {"id": "u1"})
+    assert len(adapter.sent) == 2
+
+
+def test_stalled_streamed_get_is_retried():
+    adapter = CannedAdapter(
+        canned_stream(200, StalledBody()),
+        canned_response(200, b'[{"id": "p1"}]'),
+    )
+    tester = make_tester(adapter)
+    assert tester.make_request('GET', 'products') == (True, 200, [{"id": "p1"}])
+    assert len(adapter.sent) == 2
+
+
+def test_stalled_streamed_get_fails_after_retries():
+    adapter = CannedAdapter(*(canned_stream(200, StalledBody()) for _ in range(3)))
+    tester = make_tester(adapter)
+    success, status, data = tester.make_request('GET', 'products')
+    assert (success, status) == (False, 0)
+    assert "error" in data
+
+
+@pytest.mark.parametrize("method", ['POST', 'DELETE'])
+def test_interrupted_non_idempotent_request_is_not_retried(method):
+    adapter = CannedAdapter(requests.exceptions.ChunkedEncodingError("connection broken"))
+    tester = make_tester(adapter)
+    success, status, data = tester.make_request(method, 'products', {"name": "x"})
+    assert (success, status) == (False, 0)
+    assert "error" in data
+    assert len(adapter.sent) == 1
+
+
+def test_auth_header_sent_only_with_token():
+    adapter = CannedAdapter(canned_response(200, b"{}"), canned_response(200, b"{}"))
+    tester = make_tester(adapter)
+    tester.make_request('GET', 'auth/me', token="abc")
+    tester.make_request('GET', 'auth/me')
+    assert adapter.sent[0].headers['Authorization'] == "Bearer abc"
+    assert 'Authorization' not in adapter.sent[1].headers